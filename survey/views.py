@@ -3,11 +3,16 @@ import json
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.shortcuts import redirect, render, reverse
 from django.views import View
 
 from .models import Survey, Question, Choice, SurveyAssignment
 
+# Rows per INSERT for bulk_create(); keeps large surveys under backend
+# parameter limits without many round trips.
+BULK_CREATE_BATCH_SIZE = 1000
+
 
 class RegisterView(View):
     def get(self, request):
@@ -24,8 +29,13 @@ class RegisterView(View):
 
 class ProfileView(LoginRequiredMixin, View):
     def get(self, request):
-        surveys = Survey.objects.filter(created_by=request.user).all()
-        assigned_surveys = SurveyAssignment.objects.filter(assigned_to=request.user).all()
+        surveys = Survey.objects.filter(created_by=request.user).only('id', 'title')
+        assigned_surveys = (
+            SurveyAssignment.objects
+            .filter(assigned_to=request.user)
+            .select_related('survey')
+            .only('id', 'survey__id', 'survey__title')
+        )
         # survey_results = get_objects_for_user(request.user, 'can_view_results', klass=Survey)
 
         context = {
@@ -36,10 +46,14 @@ class ProfileView(LoginRequiredMixin, View):
 
         return render(request, 'survey/profile.html', context)
 
+def _user_choices():
+    # Only the columns the assignees <select> needs.
+    return list(User.objects.order_by('username').values('id', 'username'))
+
+
 class SurveyCreateView(LoginRequiredMixin, View):
     def get(self, request):
-        users = User.objects.all()
-        return render(request, 'survey/create_survey.html', {'users': users})
+        return render(request, 'survey/create_survey.html', {'users': _user_choices()})
 
     def post(self, request):
         data = request.POST
@@ -59,24 +73,48 @@ class SurveyCreateView(LoginRequiredMixin, View):
         if not assignees:
             valid = False
             context['assignees_error'] = 'assignees are required'
+        else:
+            try:
+                assignee_ids = [int(assignee) for assignee in assignees]
+            except ValueError:
+                assignee_ids = []
+            users_map = User.objects.in_bulk(assignee_ids)
+            if not assignee_ids or len(users_map) != len(set(assignee_ids)):
+                valid = False
+                context['assignees_error'] = 'assignees are invalid'
 
         if not valid:
-            context['users'] = User.objects.all()
+            context['users'] = _user_choices()
             return render(request, 'survey/create_survey.html', context)
 
-        survey = Survey.objects.create(title=title, created_by=request.user)
-        for question_json in questions_json:
-            question_data = json.loads(question_json)
-            question = Question.objects.create(text=question_data['text'], survey=survey)
-            for choice_data in question_data['choices']:
-                Choice.objects.create(text=choice_data['text'], question=question)
-
-        for assignee in assignees:
-            assigned_to = User.objects.get(pk=int(assignee))
-            SurveyAssignment.objects.create(
-                survey=survey,
-                assigned_by=request.user,
-                assigned_to=assigned_to
-            )
+        questions_data = [json.loads(question_json) for question_json in questions_json]
+
+        # One transaction for the whole survey so a failure part way through
+        # leaves no partial rows and the writes share a single commit.
+        with transaction.atomic():
+            survey = Survey.objects.create(title=title, created_by=request.user)
+            # Questions are created one at a time because bulk_create() only sets
+            # primary keys on backends that can return them (not SQLite on Django 3.1),
+            # and the choices below need them.
+            questions = [
+                Question.objects.create(text=question_data['text'], survey=survey)
+                for question_data in questions_data
+            ]
+            choices = [
+                Choice(text=choice_data['text'], question=question)
+                for question, question_data in zip(questions, questions_data)
+                for choice_data in question_data['choices']
+            ]
+            Choice.objects.bulk_create(choices, batch_size=BULK_CREATE_BATCH_SIZE)
+
+            assignments = [
+                SurveyAssignment(
+                    survey=survey,
+                    assigned_by=request.user,
+                    assigned_to=users_map[assignee_id]
+                )
+                for assignee_id in assignee_ids
+            ]
+            SurveyAssignment.objects.bulk_create(assignments, batch_size=BULK_CREATE_BATCH_SIZE)
         
         return redirect(reverse('profile'))